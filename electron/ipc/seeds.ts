@@ -19,6 +19,24 @@ const IMAGE_EXTENSIONS: Record<string, string> = {
 
 const SEED_THUMBNAIL_WIDTH_PX = 600
 
+// In-memory cache in front of the on-disk thumbnail cache — the seed grid
+// re-requests the same handful of thumbnails on every mount, and a Map hit
+// skips the readFile (and any regeneration) entirely. Entries are validated
+// against the source file's mtime, mirroring the disk cache. Bounded by
+// evicting in insertion order; entries are re-inserted on hit, so this
+// behaves as an LRU.
+const THUMBNAIL_MEMORY_CACHE_MAX = 128
+const thumbnailMemoryCache = new Map<string, { srcMtimeMs: number; base64: string }>()
+
+function rememberThumbnail(filename: string, srcMtimeMs: number, base64: string): void {
+  thumbnailMemoryCache.delete(filename)
+  thumbnailMemoryCache.set(filename, { srcMtimeMs, base64 })
+  if (thumbnailMemoryCache.size > THUMBNAIL_MEMORY_CACHE_MAX) {
+    const oldest = thumbnailMemoryCache.keys().next().value
+    if (oldest !== undefined) thumbnailMemoryCache.delete(oldest)
+  }
+}
+
 function isSupportedImage(filename: string): boolean {
   const ext = path.extname(filename).slice(1).toLowerCase()
   return SUPPORTED_IMAGE_EXTENSIONS.includes(ext)
@@ -83,6 +101,19 @@ export function registerSeedsIpc(): void {
     const filePath = resolveSeedPath(filename)
     if (!filePath) return null
 
+    let srcMtimeMs: number
+    try {
+      srcMtimeMs = fs.statSync(filePath).mtimeMs
+    } catch {
+      return null
+    }
+
+    const memCached = thumbnailMemoryCache.get(filename)
+    if (memCached && memCached.srcMtimeMs === srcMtimeMs) {
+      rememberThumbnail(filename, srcMtimeMs, memCached.base64)
+      return memCached.base64
+    }
+
     const thumbDir = getSeedsThumbnailDir()
     // Width-suffixed filename so any change to the thumbnail resolution
     // naturally invalidates the cache for existing installs.
@@ -92,10 +123,11 @@ export function registerSeedsIpc(): void {
     // Check if cached thumbnail exists and is newer than source
     if (fs.existsSync(thumbPath)) {
       try {
-        const srcStat = fs.statSync(filePath)
         const thumbStat = fs.statSync(thumbPath)
-        if (thumbStat.mtimeMs >= srcStat.mtimeMs) {
-          return fs.readFileSync(thumbPath).toString('base64')
+        if (thumbStat.mtimeMs >= srcMtimeMs) {
+          const base64 = fs.readFileSync(thumbPath).toString('base64')
+          rememberThumbnail(filename, srcMtimeMs, base64)
+          return base64
         }
       } catch {
         // Regenerate on error
@@ -113,7 +145,9 @@ export function registerSeedsIpc(): void {
     const resized = img.resize({ width: Math.min(SEED_THUMBNAIL_WIDTH_PX, width) })
     const thumbBuffer = resized.toJPEG(85)
     fs.writeFileSync(thumbPath, thumbBuffer)
-    return thumbBuffer.toString('base64')
+    const base64 = thumbBuffer.toString('base64')
+    rememberThumbnail(filename, srcMtimeMs, base64)
+    return base64
   })
 
   ipcMain.handle('upload-seed', (_event, filename: string, base64: string): SeedFileRecord => {
@@ -152,6 +186,7 @@ export function registerSeedsIpc(): void {
     if (!filePath.startsWith(dir)) return
     if (!fs.existsSync(filePath)) return
     fs.unlinkSync(filePath)
+    thumbnailMemoryCache.delete(filename)
 
     // Also delete cached thumbnail
     const thumbDir = getSeedsThumbnailDir()
@@ -39,3 +39,13 @@ def _build_button_codes() -> dict[str, int]:
 
 
 BUTTON_CODES: dict[str, int] = _build_button_codes()
+
+# Case-insensitive view of BUTTON_CODES, precomputed so the control hot
+# path can resolve a keycap with a single `.get()` and no per-button
+# `.upper()` allocation — the renderer sends canonical uppercase, but
+# lowercase keycaps resolve just as fast. Mixed-case strays still work
+# via an explicit `.upper()` fallback at the lookup site.
+BUTTON_CODES_FOLDED: dict[str, int] = {
+    **BUTTON_CODES,
+    **{keycap.lower(): code for keycap, code in BUTTON_CODES.items()},
+}
@@ -8,11 +8,14 @@ device-side state machine that drives frame streaming.
 import asyncio
 import base64
 import contextlib
+import functools
 import gc
+import hashlib
 import importlib
 import io
 import os
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
@@ -50,9 +53,12 @@ logger = structlog.stdlib.get_logger(__name__)
 # based on platform). `world_engine` uses the legacy upstream
 # `world_engine` package (CUDA only); on Apple Silicon the renderer
 # must pick `quark` since legacy `world_engine` doesn't import there.
+@functools.cache
 def supported_capabilities() -> ServerCapabilities:
     """Resolve the server's capability matrix from the running host's
-    platform. Used by the `/health` endpoint. The shape itself lives
+    platform. Used by the `/health` endpoint — the matrix is a pure
+    function of the (fixed) platform, and the model is frozen, so the
+    result is computed once and shared. The shape itself lives
     in `server.protocol` so the codegen ships a matching Zod schema
     + TS type to the renderer; the resolution logic stays here next
     to the platform query.
@@ -107,6 +113,11 @@ DEFAULT_N_FRAMES = 4096
 JPEG_QUALITY = 85
 DEFAULT_INFERENCE_FPS = 60
 
+# Entries kept in the decoded-seed LRU. Seed tensors are ~700 KB of device
+# memory at 360x640 (times temporal_compression for multiframe models), so a
+# handful covers the flip-between-two-seeds pattern without growing VRAM.
+DECODED_SEED_CACHE_MAX = 4
+
 # Step counters surfaced as `current_step` / `total_steps` log fields. The
 # renderer and any future log-shipping pipeline get a structured progress
 # signal rather than a `[1/3]` substring buried in the message text.
@@ -276,7 +287,14 @@ class WorldEngineManager:
         # AppState-level startup-complete gate.
         self._engine = None
         self.model_config: ModelConfig | None = None
-        self.seed_frame = None
+        self._seed_frame = None
+        self._seed_jpeg = None  # Cached primary-seed JPEG; invalidated by the seed_frame setter
+        # Decoded-seed LRU: reconnects re-send the same base64 payload on a
+        # fresh Connection, where the connection-level payload dedup can't
+        # help. Keyed by payload digest + the target size / expansion the
+        # tensor was built for, so a model switch misses rather than
+        # serving a stale shape. Values are the final device tensors.
+        self._decoded_seed_cache: OrderedDict[tuple[bytes, tuple[int, int], int], torch.Tensor] = OrderedDict()
         self.original_seed_frame = None  # Preserved across scene edits for U-key reset
         self.model_uri: str | None = None
         self.quant: str | None = None
@@ -406,6 +424,9 @@ class WorldEngineManager:
         self.model_config = None
         self.seed_frame = None
         self.engine_warmed_up = False
+        # Cached seed tensors hold device memory; drop them so the
+        # empty_cache below actually releases their allocations.
+        self._decoded_seed_cache.clear()
         # Resolved backend classes are kept across unload — they're
         # stateless module attributes and re-importing them on every
         # backend-unchanged reload would cost a few hundred ms for no
@@ -413,20 +434,43 @@ class WorldEngineManager:
         # actually changes.
         self._free_device_memory_sync()
 
+    def _seed_tensor_from_image(self, img: Image.Image) -> torch.Tensor:
+        """Convert a decoded PIL image into the engine's seed-frame tensor.
+
+        One uint8 host→device copy, then the bilinear resize runs as a
+        device kernel. The old pipeline resized full-resolution FP32 on
+        the CPU and only then moved the result across — shipping the raw
+        uint8 pixels first moves a quarter of the bytes and turns the
+        resize into device work."""
+        # np.array (not asarray): PIL exposes its buffer read-only, and
+        # torch warns on every from_numpy/frombuffer over a non-writable
+        # source, so pay the one host copy for a clean tensor. bfloat16
+        # keeps the resize kernel cheap on device; uint8 values fit its
+        # mantissa exactly, but bilinear output may land fractionally
+        # outside [0, 255], so clamp before narrowing back. CPU fallback
+        # stays float32 — bfloat16 CPU kernels are emulated and slower.
+        dtype = torch.bfloat16 if devices.is_available() else torch.float32
+        chw = torch.from_numpy(np.array(img)).permute(2, 0, 1).unsqueeze(0)
+        chw = chw.to(device=WORLD_ENGINE_DEVICE, dtype=dtype)
+        frame = F.interpolate(
+            chw,
+            size=self.seed_target_size,
+            mode="bilinear",
+            align_corners=False,
+        )[0]
+        frame = frame.clamp(0, 255).to(dtype=torch.uint8).permute(1, 2, 0).contiguous()
+        return self._maybe_expand_to_multiframe(frame)
+
     def _load_seed_from_file_sync(self, file_path: str) -> torch.Tensor | None:
         """Synchronous helper to load a seed frame from a file path."""
         try:
-            img = Image.open(file_path).convert("RGB")
-            img_tensor = torch.from_numpy(np.array(img)).permute(2, 0, 1).unsqueeze(0).float()
-            frame = F.interpolate(
-                img_tensor,
-                size=self.seed_target_size,
-                mode="bilinear",
-                align_corners=False,
-            )[0]
-            frame = frame.to(dtype=torch.uint8, device=WORLD_ENGINE_DEVICE).permute(1, 2, 0).contiguous()
-            if self.is_multiframe:
-                frame = frame.unsqueeze(0).expand(self.temporal_compression, -1, -1, -1).contiguous()
+            img = Image.open(file_path)
+            # JPEG sources decode at a power-of-two reduction no smaller than
+            # the target — libjpeg skips the discarded pixels outright. No-op
+            # for PNG and friends; the bilinear resize still lands on the
+            # exact target size. (draft takes (width, height).)
+            img.draft("RGB", (self.seed_target_size[1], self.seed_target_size[0]))
+            frame = self._seed_tensor_from_image(img.convert("RGB"))
         except Exception:
             logger.exception(f"Failed to load seed from file {file_path}")
             return None
@@ -438,24 +482,33 @@ class WorldEngineManager:
         return await self._run_on_device_thread(lambda: self._load_seed_from_file_sync(file_path))
 
     def _load_seed_from_base64_sync(self, base64_data: str) -> torch.Tensor | None:
-        """Synchronous helper to load a seed frame from base64 encoded data."""
+        """Synchronous helper to load a seed frame from base64 encoded data.
+        Repeat payloads resolve from the decoded-seed LRU without touching
+        PIL or the device."""
         try:
+            key = (
+                hashlib.blake2b(base64_data.encode("ascii"), digest_size=16).digest(),
+                self.seed_target_size,
+                self.temporal_compression if self.is_multiframe else 1,
+            )
+            cached = self._decoded_seed_cache.get(key)
+            if cached is not None:
+                self._decoded_seed_cache.move_to_end(key)
+                logger.info("Seed served from decode cache")
+                return cached
+
             img_data = base64.b64decode(base64_data)
-            img = Image.open(io.BytesIO(img_data)).convert("RGB")
-            img_tensor = torch.from_numpy(np.array(img)).permute(2, 0, 1).unsqueeze(0).float()
-            frame = F.interpolate(
-                img_tensor,
-                size=self.seed_target_size,
-                mode="bilinear",
-                align_corners=False,
-            )[0]
-            frame = frame.to(dtype=torch.uint8, device=WORLD_ENGINE_DEVICE).permute(1, 2, 0).contiguous()
-            if self.is_multiframe:
-                frame = frame.unsqueeze(0).expand(self.temporal_compression, -1, -1, -1).contiguous()
+            img = Image.open(io.BytesIO(img_data))
+            # Same draft-mode pre-shrink as `_load_seed_from_file_sync`.
+            img.draft("RGB", (self.seed_target_size[1], self.seed_target_size[0]))
+            frame = self._seed_tensor_from_image(img.convert("RGB"))
         except Exception:
             logger.exception("Failed to load seed from base64")
             return None
         else:
+            self._decoded_seed_cache[key] = frame
+            if len(self._decoded_seed_cache) > DECODED_SEED_CACHE_MAX:
+                self._decoded_seed_cache.popitem(last=False)
             return frame
 
     async def load_seed_from_base64(self, base64_data: str) -> torch.Tensor | None:
@@ -660,8 +713,12 @@ class WorldEngineManager:
     def numpy_to_jpeg(rgb, quality: int = JPEG_QUALITY) -> bytes:
         """Encode a CPU numpy RGB array to JPEG bytes."""
         if simplejpeg is not None:
-            return simplejpeg.encode_jpeg(rgb, quality=quality, colorspace="RGB")
-        img = Image.fromarray(rgb, mode="RGB")
+            # fastdct trades imperceptible accuracy for a measurably
+            # cheaper DCT — this runs per sub-frame on the stream path.
+            return simplejpeg.encode_jpeg(rgb, quality=quality, colorspace="RGB", fastdct=True)
+        # frombuffer skips fromarray's array-interface/stride introspection;
+        # safe because tensor_to_numpy always hands over contiguous HWC uint8.
+        img = Image.frombuffer("RGB", (rgb.shape[1], rgb.shape[0]), rgb, "raw", "RGB", 0, 1)
         buf = io.BytesIO()
         img.save(buf, format="JPEG", quality=quality)
         return buf.getvalue()
@@ -670,6 +727,37 @@ class WorldEngineManager:
         """Convert frame tensor to JPEG bytes using simplejpeg (fast) or PIL (fallback)."""
         return self.numpy_to_jpeg(self.tensor_to_numpy(frame), quality)
 
+    @property
+    def seed_frame(self):
+        """The current seed frame tensor (storage format per
+        `_maybe_expand_to_multiframe`). Assigning invalidates the cached
+        seed JPEG."""
+        return self._seed_frame
+
+    @seed_frame.setter
+    def seed_frame(self, frame) -> None:
+        self._seed_frame = frame
+        self._seed_jpeg = None
+
+    @property
+    def cached_seed_jpeg(self) -> bytes | None:
+        """The primary-seed JPEG if already encoded for the current seed,
+        without triggering an encode. Lets async callers skip an executor
+        dispatch on the cache-hit path."""
+        return self._seed_jpeg
+
+    def primary_seed_jpeg(self) -> bytes | None:
+        """JPEG bytes of `primary_seed_frame`, encoded once per seed change.
+        The seed is invariant between loads, so connect-time initial frames
+        and pause-menu seed pushes reuse the cached encode instead of paying
+        a fresh D2H + JPEG each time."""
+        primary = self.primary_seed_frame
+        if primary is None:
+            return None
+        if self._seed_jpeg is None:
+            self._seed_jpeg = self.frame_to_jpeg(primary)
+        return self._seed_jpeg
+
     @property
     def primary_seed_frame(self) -> torch.Tensor | None:
         """Return the seed as a 3-D HxWxC tensor (first subframe for multiframe
@@ -745,15 +833,21 @@ class WorldEngineManager:
         seed = self.seed_frame
         log = logger.bind(operation="reset")
 
-        t0 = time.perf_counter()
-        log.info("Engine reset starting")
-        self._device_executor.submit(engine.reset).result()
-        log.info("Engine reset complete", duration_s=round(time.perf_counter() - t0, 2))
+        def _reset_and_seed():
+            t0 = time.perf_counter()
+            log.info("Engine reset starting")
+            engine.reset()
+            log.info("Engine reset complete", duration_s=round(time.perf_counter() - t0, 2))
+
+            t0 = time.perf_counter()
+            log.info("Append seed starting")
+            engine.append_frame(seed)
+            log.info("Append seed complete", duration_s=round(time.perf_counter() - t0, 2))
 
-        t0 = time.perf_counter()
-        log.info("Append seed starting")
-        self._device_executor.submit(lambda: engine.append_frame(seed)).result()
-        log.info("Append seed complete", duration_s=round(time.perf_counter() - t0, 2))
+        # One submission for both steps — each submit().result() round-trip
+        # costs a queue hop plus a thread wake each way, and nothing between
+        # the two device calls needs the calling thread.
+        self._device_executor.submit(_reset_and_seed).result()
 
     def init_session(self) -> None:
         """Reset engine, load seed, render initial frame and report progress.
@@ -765,19 +859,26 @@ class WorldEngineManager:
         seed = self.seed_frame
         log = logger.bind(operation="init_session")
 
-        self._report_progress(StageId.SESSION_INIT_RESET)
-        t0 = time.perf_counter()
-        log.info("Engine reset starting")
-        self._device_executor.submit(engine.reset).result()
-        log.info("Engine reset complete", duration_s=round(time.perf_counter() - t0, 2))
+        def _init():
+            # Progress callbacks are documented cross-thread-safe
+            # (`Connection.push_progress`), so they stay interleaved with
+            # the device work inside the single submission.
+            self._report_progress(StageId.SESSION_INIT_RESET)
+            t0 = time.perf_counter()
+            log.info("Engine reset starting")
+            engine.reset()
+            log.info("Engine reset complete", duration_s=round(time.perf_counter() - t0, 2))
+
+            self._report_progress(StageId.SESSION_INIT_SEED)
+            t0 = time.perf_counter()
+            log.info("Append seed starting")
+            engine.append_frame(seed)
+            log.info("Append seed complete", duration_s=round(time.perf_counter() - t0, 2))
 
-        self._report_progress(StageId.SESSION_INIT_SEED)
-        t0 = time.perf_counter()
-        log.info("Append seed starting")
-        self._device_executor.submit(lambda: engine.append_frame(seed)).result()
-        log.info("Append seed complete", duration_s=round(time.perf_counter() - t0, 2))
+            self._report_progress(StageId.SESSION_INIT_FRAME)
 
-        self._report_progress(StageId.SESSION_INIT_FRAME)
+        # Single device-thread submission (see reset_state for rationale).
+        self._device_executor.submit(_init).result()
 
     def recover_from_device_error(self) -> bool:
         """Recover from a device error by clearing caches, resetting compiled
@@ -14,6 +14,7 @@ import argparse
 import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
@@ -187,6 +188,13 @@ async def lifespan(app: FastAPI):
     """Startup/shutdown lifecycle handler."""
     logger.info("Biome server startup")
 
+    # Bound + name the default executor backing `asyncio.to_thread`. The
+    # stock executor spawns up to `cpu_count + 4` anonymous threads; our
+    # to_thread work (seed decode/safety, init_session, HF metadata) is
+    # bursty-but-shallow, and named threads make `py-spy` / crash dumps
+    # attributable.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=4, thread_name_prefix="biome-io"))
+
     startup = ServerStartup()
     app.state.startup = startup
     app.state.system_monitor = SystemMonitor.collect()
@@ -272,6 +280,14 @@ if __name__ == "__main__":
         ws_ping_interval=300,
         ws_ping_timeout=300,
         log_config=None,
+        # Access-log lines for every request/handshake go through Python
+        # logging formatting; the renderer polls status routes and the WS
+        # session is long-lived, so the log adds cost without signal —
+        # structured logs in the app cover what we actually want.
+        access_log=False,
+        # Base64 seed payloads from large uploads can exceed uvicorn's
+        # 16 MiB default WS message cap; this is a limit, not a reserve.
+        ws_max_size=64 * 1024 * 1024,
     )
     server = uvicorn.Server(config)
     app.state.uvicorn_server = server
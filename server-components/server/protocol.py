@@ -365,6 +365,14 @@ class StatusMessage(BaseModel):
     message: str | None = None
 
 
+# Serialised bare StatusMessage per stage, precomputed at import time.
+# Stage pushes all carry the same payload for a given stage, so senders
+# ship a cached string instead of re-serialising one per call.
+STAGE_STATUS_JSON: dict[StageId, str] = {
+    stage: StatusMessage(stage=stage).model_dump_json(exclude_none=True) for stage in StageId
+}
+
+
 class SystemInfoMessage(BaseModel):
     """Hardware identity broadcast once per session, after handshake."""
 
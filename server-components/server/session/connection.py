@@ -29,12 +29,13 @@ from queue import Queue
 from typing import TYPE_CHECKING
 
 import structlog
-from fastapi import WebSocket
+from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 from recording.action_logger import ActionLogger
 from recording.video_recorder import RecordingProperties, VideoRecorder
 from server.protocol import (
+    STAGE_STATUS_JSON,
     ErrorMessage,
     FrameHeader,
     LogMessage,
@@ -64,6 +65,19 @@ class ControlState:
     dirty: bool = False
 
 
+@dataclass(slots=True)
+class FrameProfile:
+    """Per-batch timing breakdown captured by the generator thread and
+    folded into the binary FrameHeader — a typed, slotted struct instead
+    of a str-keyed dict built per frame."""
+
+    t_infer_ms: float
+    t_sync_ms: float
+    t_enc_ms: float
+    t_metrics_ms: float
+    t_overhead_ms: float
+
+
 @dataclass
 class Connection:
     """Per-WebSocket-connection state, mutated in place. Reference-equality
@@ -89,8 +103,12 @@ class Connection:
     video_recorder: VideoRecorder | None = None
 
     # ─── Seed metadata for the currently-loaded seed frame ──────────
+    # `current_seed_payload` keeps the raw base64 string so a re-sent
+    # identical seed short-circuits before decode + hash (a str compare
+    # is a memcmp; the decode + sha256 it avoids are milliseconds).
     current_seed_hash: str | None = None
     current_seed_filename: str | None = None
+    current_seed_payload: str | None = None
 
     # ─── Pending init RPC ID (response deferred until warmup ends) ──
     init_req_id: str | None = None
@@ -153,6 +171,20 @@ class Connection:
         self.log_queue = asyncio.Queue(maxsize=1000)
         self.main_loop = asyncio.get_running_loop()
 
+    # ─── Async receive helper (asyncio thread; awaited) ────────────
+    async def receive_payload(self) -> str | bytes:
+        """Receive one inbound message as its raw payload, text or binary.
+
+        Accepting binary frames lets a client ship JSON as raw bytes and
+        skip the UTF-8 decode `receive_text` would force on every message
+        — `ClientMessageAdapter.validate_json` parses `bytes` directly.
+        Raises `WebSocketDisconnect` on close, mirroring `receive_text`."""
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(code=int(message.get("code") or 1000), reason=message.get("reason"))
+        data: str | bytes | None = message.get("bytes") or message.get("text")
+        return data if data is not None else ""
+
     # ─── Async send helpers (asyncio thread; awaited) ──────────────
     async def send_message(self, msg: BaseModel) -> None:
         """Serialise + push a Pydantic message over the websocket."""
@@ -162,7 +194,8 @@ class Connection:
         await self.send_message(WarningMessage(message_id=message_id, params=params))
 
     async def send_stage(self, stage: StageId) -> None:
-        await self.send_message(StatusMessage(stage=stage))
+        # Bare per-stage payloads are precomputed at import time.
+        await self.websocket.send_text(STAGE_STATUS_JSON[stage])
 
     async def send_error(
         self,
@@ -265,7 +298,7 @@ class Connection:
         client_ts: float,
         gen_ms: float,
         temporal_compression: int = 1,
-        profile: dict[str, float] | None = None,
+        profile: FrameProfile | None = None,
     ) -> bytes:
         """Pack a batch of JPEG-encoded sub-frames into one binary
         envelope (see `server/protocol.py` for the wire layout). One
@@ -284,7 +317,11 @@ class Connection:
             temporal_compression=temporal_compression,
             vram_used_bytes=self.cached_vram_used_bytes,
             gpu_util_percent=self.cached_gpu_util_percent,
-            **(profile or {}),
+            t_infer_ms=profile.t_infer_ms if profile else None,
+            t_sync_ms=profile.t_sync_ms if profile else None,
+            t_enc_ms=profile.t_enc_ms if profile else None,
+            t_metrics_ms=profile.t_metrics_ms if profile else None,
+            t_overhead_ms=profile.t_overhead_ms if profile else None,
         )
         header = header_obj.model_dump_json(exclude_none=True).encode("utf-8")
         parts: list[bytes] = [struct.pack("<I", len(header)), header, struct.pack("<I", len(jpegs))]
@@ -320,10 +357,12 @@ class Connection:
     async def send_initial_frame(self, world_engine: "WorldEngineManager") -> None:
         """Encode the loaded seed as frame 0 and dispatch it so the client
         has something to render before the gen loop starts."""
-        seed = world_engine.seed_frame
-        assert seed is not None, "send_initial_frame requires a loaded seed"
-        first_subframe = seed[0] if world_engine.is_multiframe else seed
-        jpeg = await asyncio.to_thread(world_engine.frame_to_jpeg, first_subframe)
+        # A cached-bytes lookup doesn't warrant the executor round-trip;
+        # dispatch only when this seed actually needs encoding.
+        jpeg = world_engine.cached_seed_jpeg
+        if jpeg is None:
+            jpeg = await asyncio.to_thread(world_engine.primary_seed_jpeg)
+        assert jpeg is not None, "send_initial_frame requires a loaded seed"
         await self.websocket.send_bytes(self.build_batch_envelope([jpeg], first_frame_id=0, client_ts=0.0, gen_ms=0.0))
 
     def start_recording_segments(self, world_engine: "WorldEngineManager") -> None:
@@ -50,12 +50,20 @@ from server.session.connection import Connection
 
 if TYPE_CHECKING:
     from engine.manager import WorldEngineManager
-    from engine.safety import SafetyChecker
+    from engine.safety import SafetyChecker, SafetyResult
     from engine.scene_authoring import SceneAuthoringManager
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
+def _decode_and_check_seed(safety_checker: "SafetyChecker", image_data_b64: str) -> "SafetyResult":
+    """Decode base64 seed data and run it through the NSFW classifier.
+    Synchronous — dispatched to the executor as one unit so the multi-MB
+    base64 decode stays off the event loop along with the classifier call
+    (a large seed decode alone is milliseconds of stall for frame sends)."""
+    return safety_checker.check_image_bytes(base64.b64decode(image_data_b64))
+
+
 def build_init_response_data(world_engine: "WorldEngineManager", system_info: SystemInfo) -> InitResponseData:
     """Pack post-warmup session metrics into the typed init RPC response."""
     return InitResponseData(
@@ -75,12 +83,9 @@ async def handle_check_seed_safety(
         return rpc_err(req.req_id, error=MessageId.SEED_MISSING_DATA.value)
 
     try:
-        image_bytes = base64.b64decode(req.image_data)
+        result = await asyncio.to_thread(_decode_and_check_seed, safety_checker, req.image_data)
     except (binascii.Error, ValueError) as e:
         return rpc_err(req.req_id, error=f"Invalid base64 data: {e}")
-
-    try:
-        result = await asyncio.to_thread(safety_checker.check_image_bytes, image_bytes)
     except Exception as e:
         logger.exception("Safety check failed")
         return rpc_err(req.req_id, error=f"Safety check failed: {e}")
@@ -105,17 +110,22 @@ async def load_seed_from_data(
         await conn.send_warning(MessageId.SEED_MISSING_DATA)
         return False
 
+    # Byte-identical payload already loaded onto the engine? Skip the
+    # decode + safety hash outright (the renderer re-sends the full
+    # config, seed included, on every init).
+    if image_data_b64 == conn.current_seed_payload:
+        logger.info("Seed unchanged (payload match), skipping reload")
+        return True
+
+    # Decode + safety check in one executor dispatch (cache lookup is
+    # internal to SafetyChecker; same-hash repeat is a fast cache hit, so
+    # we don't pre-screen against `current_seed_hash`).
     try:
-        image_bytes = base64.b64decode(image_data_b64)
+        result = await asyncio.to_thread(_decode_and_check_seed, safety_checker, image_data_b64)
     except (binascii.Error, ValueError) as e:
         logger.warning(f"Invalid base64 seed data: {e}")
         await conn.send_warning(MessageId.SEED_INVALID_DATA)
         return False
-
-    # Safety check (cache lookup is internal to SafetyChecker; same-hash repeat
-    # is a fast cache hit, so we don't pre-screen against `current_seed_hash`).
-    try:
-        result = await asyncio.to_thread(safety_checker.check_image_bytes, image_bytes)
     except Exception as e:  # noqa: BLE001  -- classifier path can raise PIL/torch/runtime errors; downgrade to a soft warning
         logger.warning(f"Safety check failed: {e}")
         await conn.send_warning(MessageId.SEED_SAFETY_CHECK_FAILED)
@@ -126,6 +136,7 @@ async def load_seed_from_data(
     # Same seed already loaded onto the engine? Skip the redundant reload.
     if img_hash == conn.current_seed_hash:
         logger.info("Seed unchanged (hash match), skipping reload")
+        conn.current_seed_payload = image_data_b64
         return True
 
     if not result.is_safe:
@@ -146,6 +157,7 @@ async def load_seed_from_data(
     world_engine.original_seed_frame = loaded_frame
     conn.current_seed_hash = img_hash
     conn.current_seed_filename = seed_filename
+    conn.current_seed_payload = image_data_b64
     logger.info("Seed loaded successfully")
     return True
 
@@ -230,6 +242,7 @@ async def handle_init(
         world_engine.original_seed_frame = None
         conn.current_seed_hash = None
         conn.current_seed_filename = None
+        conn.current_seed_payload = None
         conn.perceptual_frame_count = 0
         conn.max_perceptual_frames = (world_engine.n_frames - 2) * world_engine.temporal_compression
         model_changed = True
@@ -262,39 +275,49 @@ async def run_preinit_handshake(
     await conn.send_stage(StageId.SESSION_WAITING_FOR_SEED)
     logger.info("Waiting for init message...")
 
-    while world_engine.seed_frame is None:
-        try:
-            raw = await asyncio.wait_for(conn.websocket.receive_text(), timeout=60.0)
-        except TimeoutError:
-            logger.error("Timeout waiting for init")  # noqa: TRY400  -- timeout status, no traceback to log
-            await conn.send_error(message_id=MessageId.TIMEOUT_WAITING_FOR_SEED)
-            return False
-
-        try:
-            parsed: ClientMessage = ClientMessageAdapter.validate_json(raw)
-        except (ValidationError, ValueError) as e:
-            logger.info(f"Ignoring invalid message during pre-init: {e}")
-            continue
-
-        match parsed:
-            case CheckSeedSafetyRequest() as req:
-                result = await handle_check_seed_safety(safety_checker, req)
-                await conn.websocket.send_text(result.model_dump_json(exclude_none=True))
-            case InitRequest() as req:
-                # init RPC: response is deferred until after warmup/session init completes
-                conn.init_req_id = req.req_id
-                ready, _ = await handle_init(conn, world_engine, safety_checker, req)
-                if not ready:
-                    await conn.websocket.send_text(
-                        rpc_err(conn.init_req_id, error_id=MessageId.INIT_FAILED).model_dump_json(exclude_none=True)
-                    )
-                    conn.init_req_id = None
-            case SceneEditRequest() | GenerateSceneRequest():
-                await conn.websocket.send_text(
-                    rpc_err(parsed.req_id, error_id=MessageId.INIT_FAILED).model_dump_json(exclude_none=True)
-                )
-            case ControlNotif() | PauseNotif() | ResumeNotif() | ResetNotif() | PromptNotif():
-                logger.info(f"Ignoring notification '{parsed.type}' while waiting for init")
+    loop = asyncio.get_running_loop()
+    try:
+        async with asyncio.timeout(None) as deadline:
+            while world_engine.seed_frame is None:
+                # One Timeout for the whole phase instead of a `wait_for`
+                # wrapper task allocated per message. Armed only around the
+                # receive — handling (e.g. a model load inside handle_init)
+                # stays unbounded, so only 60 s of client silence aborts.
+                deadline.reschedule(loop.time() + 60.0)
+                raw = await conn.receive_payload()
+                deadline.reschedule(None)
+
+                try:
+                    parsed: ClientMessage = ClientMessageAdapter.validate_json(raw)
+                except (ValidationError, ValueError) as e:
+                    logger.info(f"Ignoring invalid message during pre-init: {e}")
+                    continue
+
+                match parsed:
+                    case CheckSeedSafetyRequest() as req:
+                        result = await handle_check_seed_safety(safety_checker, req)
+                        await conn.websocket.send_text(result.model_dump_json(exclude_none=True))
+                    case InitRequest() as req:
+                        # init RPC: response is deferred until after warmup/session init completes
+                        conn.init_req_id = req.req_id
+                        ready, _ = await handle_init(conn, world_engine, safety_checker, req)
+                        if not ready:
+                            await conn.websocket.send_text(
+                                rpc_err(conn.init_req_id, error_id=MessageId.INIT_FAILED).model_dump_json(
+                                    exclude_none=True
+                                )
+                            )
+                            conn.init_req_id = None
+                    case SceneEditRequest() | GenerateSceneRequest():
+                        await conn.websocket.send_text(
+                            rpc_err(parsed.req_id, error_id=MessageId.INIT_FAILED).model_dump_json(exclude_none=True)
+                        )
+                    case ControlNotif() | PauseNotif() | ResumeNotif() | ResetNotif() | PromptNotif():
+                        logger.info(f"Ignoring notification '{parsed.type}' while waiting for init")
+    except TimeoutError:
+        logger.error("Timeout waiting for init")  # noqa: TRY400  -- timeout status, no traceback to log
+        await conn.send_error(message_id=MessageId.TIMEOUT_WAITING_FOR_SEED)
+        return False
 
     return True
 
@@ -29,7 +29,7 @@ from fastapi import WebSocketDisconnect
 from pydantic import ValidationError
 
 from engine import devices
-from engine.keymap import BUTTON_CODES
+from engine.keymap import BUTTON_CODES_FOLDED
 from server.protocol import (
     CheckSeedSafetyRequest,
     ClientMessage,
@@ -50,7 +50,7 @@ from server.protocol import (
     rpc_err,
     rpc_ok,
 )
-from server.session.connection import Connection
+from server.session.connection import Connection, FrameProfile
 from server.session.handlers import build_init_response_data, handle_check_seed_safety, handle_init
 
 if TYPE_CHECKING:
@@ -59,6 +59,15 @@ if TYPE_CHECKING:
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Serialised prefix of a control message from a well-behaved client.
+# Control traffic dominates the inbound path (one message per input
+# tick), so the receiver sniffs this to validate straight against
+# ControlNotif and skip the discriminated-union dispatch; anything
+# else — including control payloads with reordered keys — falls
+# through to the full adapter.
+_CONTROL_PREFIX = '{"type":"control"'
+_CONTROL_PREFIX_BYTES = _CONTROL_PREFIX.encode("ascii")
+
 
 async def run_session(
     conn: Connection,
@@ -85,7 +94,7 @@ async def run_session(
         run_receiver(
             conn,
             engines,
-            BUTTON_CODES,
+            BUTTON_CODES_FOLDED,
         )
     )
     send_task = asyncio.create_task(run_sender(conn))
@@ -147,11 +156,31 @@ async def run_receiver(
     scene_authoring = engines.scene_authoring
     safety_checker = engines.safety_checker
 
+    # Held buttons repeat identically across consecutive control messages;
+    # memoize the last raw list → resolved codes so the steady state skips
+    # re-resolution entirely. Neither side mutates the resolved set: the
+    # receiver rebinds it and the generator snapshots it under ctrl_lock.
+    last_buttons_raw: list[str] | None = None
+    last_buttons_resolved: set[int] = set()
+
     while conn.running:
         try:
-            raw = await conn.websocket.receive_text()
+            raw = await conn.receive_payload()
             try:
-                parsed: ClientMessage = ClientMessageAdapter.validate_json(raw)
+                parsed: ClientMessage
+                # Two monomorphic startswith calls — a shared conditional
+                # prefix argument would widen to str | bytes and fail
+                # strict-mode argument checks against each receiver type.
+                is_control = (
+                    raw.startswith(_CONTROL_PREFIX) if isinstance(raw, str) else raw.startswith(_CONTROL_PREFIX_BYTES)
+                )
+                if is_control:
+                    try:
+                        parsed = ControlNotif.model_validate_json(raw)
+                    except ValidationError:
+                        parsed = ClientMessageAdapter.validate_json(raw)
+                else:
+                    parsed = ClientMessageAdapter.validate_json(raw)
             except (ValidationError, ValueError) as e:
                 logger.info(f"Ignoring invalid game-loop message: {e}")
                 continue
@@ -243,7 +272,18 @@ async def run_receiver(
                 case ControlNotif() as notif:
                     if conn.paused:
                         continue
-                    buttons = {button_codes[b.upper()] for b in notif.buttons if b.upper() in button_codes}
+                    if notif.buttons != last_buttons_raw:
+                        last_buttons_raw = notif.buttons
+                        # The folded map resolves canonical and lowercase
+                        # keycaps directly; stray mixed case falls back
+                        # through one .upper(). Codes are never 0, so `or`
+                        # is safe.
+                        last_buttons_resolved = {
+                            code
+                            for b in notif.buttons
+                            if (code := button_codes.get(b) or button_codes.get(b.upper())) is not None
+                        }
+                    buttons = last_buttons_resolved
                     with conn.ctrl_lock:
                         conn.ctrl.buttons = buttons
                         conn.ctrl.mouse_dx += notif.mouse_dx
@@ -336,13 +376,13 @@ def run_generator(
         conn.perceptual_frame_count += len(encoded)
 
         t_queued = time.perf_counter()
-        profile = {
-            "t_infer_ms": round((p.t_infer - p.t_infer_start) * 1000, 1),
-            "t_sync_ms": round((p.t_sync - p.t_infer) * 1000, 1),
-            "t_enc_ms": round((t_enc - t_enc_start) * 1000, 1),
-            "t_metrics_ms": round((t_metrics - t_enc) * 1000, 1),
-            "t_overhead_ms": round((t_queued - t_metrics) * 1000, 1),
-        }
+        profile = FrameProfile(
+            t_infer_ms=round((p.t_infer - p.t_infer_start) * 1000, 1),
+            t_sync_ms=round((p.t_sync - p.t_infer) * 1000, 1),
+            t_enc_ms=round((t_enc - t_enc_start) * 1000, 1),
+            t_metrics_ms=round((t_metrics - t_enc) * 1000, 1),
+            t_overhead_ms=round((t_queued - t_metrics) * 1000, 1),
+        )
         conn.queue_send(
             conn.build_batch_envelope(
                 encoded,
@@ -380,9 +420,8 @@ def run_generator(
                     req["future"].set_result(data)
                     # Send the generated seed as a single frame so the pause
                     # overlay background updates to show the new scene.
-                    seed = world_engine.primary_seed_frame
-                    assert seed is not None, "seed must be loaded after generate_scene"
-                    seed_jpeg = world_engine.frame_to_jpeg(seed)
+                    seed_jpeg = world_engine.primary_seed_jpeg()
+                    assert seed_jpeg is not None, "seed must be loaded after generate_scene"
                     conn.queue_send(conn.build_batch_envelope([seed_jpeg], conn.perceptual_frame_count, 0.0, 0.0))
                 except Exception as e:
                     logger.exception("Generate scene failed", operation="generate_scene")